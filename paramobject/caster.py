@@ -3,8 +3,8 @@ Definition of ParameterCaster.
 
 Each stored parameter has a caster defined in its owning class. If no cast is
 specified in the class using the `Parameter.caster` decorator, the
-ParametrizedObjectMeta metaclass will make sure that a default caster will be
-present in the owning class.
+ParametrizedObject.__init_subclass__ hook will make sure that a default caster
+will be present in the owning class.
 
 Casters are used during the parametrized object initialization. The latter
 computes the value of the parameters from the **kwargs received in the
@@ -50,6 +50,8 @@ class ParameterCaster: # pylint: disable=too-few-public-methods
     Used to compute a parameter value from the __init__ **kwargs.
     '''
 
+    __slots__ = ('parameter', '_caster_func', '_resolved_caster_func')
+
     def __init__(self, parameter, caster_func=None):
 
         if not isinstance(parameter, paramobject.Parameter):
@@ -64,24 +66,10 @@ class ParameterCaster: # pylint: disable=too-few-public-methods
         Returns the caster function to use.
 
         If a custom caster function is defined, the latter is returned.
-        Otherwise, a default caster function is returned.
+        Otherwise, the default caster function is returned.
         '''
 
-        #pylint: disable-next=unused-argument
-        def default_caster_func(instance, default, **kwargs):
-            '''
-            Default caster function.
-
-            Returns the value of the parameter directly given in **kwargs.
-            '''
-
-            return kwargs.get(self.parameter.name, default)
-
-        if self._caster_func is None:
-
-            return default_caster_func
-
-        return self._caster_func
+        return self._resolved_caster_func
 
     @caster_func.setter
     def caster_func(self, func):
@@ -91,51 +79,82 @@ class ParameterCaster: # pylint: disable=too-few-public-methods
 
         self._caster_func = func
 
-    def __get__(self, instance, owner=None):
+        # resolve the function once instead of on each lookup
+        if func is None:
+            self._resolved_caster_func = self.default_caster_func
+        else:
+            self._resolved_caster_func = func
 
-        if instance is None:
-            return self
+    @property
+    def has_custom_caster(self):
+        '''True if a custom caster function is defined.'''
+        return self._caster_func is not None
 
-        # check that the parameter has a name
-        if self.parameter.name is None:
-            raise RuntimeError('A name must be attributed to the parameter in '
-                               'order to be used.')
+    #pylint: disable-next=unused-argument
+    def default_caster_func(self, instance, default, **kwargs):
+        '''
+        Default caster function.
 
-        def wrapper(instance, *args, **kwargs):
-            '''
-            Caster function wrapper.
+        Returns the value of the parameter directly given in **kwargs.
+        '''
 
-            This wrapper handles the case were a parametrized object is given
-            in the __init__ arguments. In this case, the given object stored
-            parameters are extracted into the **kwargs.
+        return kwargs.get(self.parameter.name, default)
 
-            This wrapper also provide the parameter default value to the
-            caster function.
-            '''
+    def cast(self, instance, *args, **kwargs):
+        '''
+        Computes the parameter value of instance from the __init__ arguments.
 
-            # if an object might have been given as argument
-            if args:
+        This handles the case were a parametrized object is given in the
+        __init__ arguments. In this case, the given object stored parameters
+        are extracted into the **kwargs.
 
-                obj, = args
+        This also provide the parameter default value to the caster function.
+        '''
+
+        # if an object might have been given as argument
+        if args:
+
+            obj, = args
 
-                if not isinstance(obj, instance.__class__):
-                    raise TypeError(f'A instance of the class '
-                                    f'{instance.__class__} or one of its '
-                                    f'subclasses is expected, not: '
-                                    f'{type(obj)}.')
+            if not isinstance(obj, instance.__class__):
+                raise TypeError(f'A instance of the class '
+                                f'{instance.__class__} or one of its '
+                                f'subclasses is expected, not: '
+                                f'{type(obj)}.')
 
-                params = dict(obj.stored_params)
+            # the raw stored values, bypassing the parameters getters
+            stored = obj.params_storage
 
-            else:
-                params = {}
+        else:
+            stored = {}
+
+        # default caster: the value is directly taken from kwargs or from the
+        # given object, without merging them
+        if self._caster_func is None:
 
-            # overwrite params given by kwargs
-            params.update(kwargs)
+            name = self.parameter.name
 
-            # gather default value
-            default = getattr(instance.__class__, self.parameter.name).default
+            if name in kwargs:
+                return kwargs[name]
 
-            return self.caster_func(instance, default, **params)
+            return stored.get(name, self.parameter.default)
+
+        # overwrite params given by kwargs
+        params = stored.copy()
+        params.update(kwargs)
+
+        return self._resolved_caster_func(instance, self.parameter.default,
+                                          **params)
+
+    def __get__(self, instance, owner=None):
+
+        if instance is None:
+            return self
+
+        # check that the parameter has a name
+        if self.parameter.name is None:
+            raise RuntimeError('A name must be attributed to the parameter in '
+                               'order to be used.')
 
-        # return the caster function wrapper bound to the instance
-        return MethodType(wrapper, instance)
+        # return the caster bound to the instance
+        return MethodType(self.cast, instance)
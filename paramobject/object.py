@@ -5,45 +5,84 @@ Parameter must be contained in a ParametrizedObject in order to work as
 expected.
 '''
 
-from abc import ABCMeta, ABC
-from inspect import getmembers
-from .storage import StaticDict, ParametersView
+import sys
+from .storage import ParametersView
 from .parameter import Parameter
+from .caster import ParameterCaster
 
 
-from dataclasses import dataclass
-
-class ParametrizedObjectMeta(ABCMeta):
+def _wire_parameters(cls):
     '''
-    Metaclass for parametrized object.
-
-    This metaclass set the name stored in each parameter. It also makes sure,
-    that every parameter has its corresponding wither and all stored parameter
-    has its corresponding caster.
+    Wires the parameters of a parametrized class.
+
+    This set the name stored in each parameter. It also makes sure, that every
+    parameter has its corresponding wither and all stored parameter has its
+    corresponding caster.
+
+    The names of the parameters (including the inherited ones) and the casters
+    of the stored parameters are gathered once in the class attributes
+    `_param_names`, `_stored_param_names` and `_stored_casters`. Frozen sets of
+    the names are also stored in `_param_names_set` and
+    `_stored_param_names_set`.
+    `_has_custom_casters` tells if any stored parameter has a custom caster,
+    casters defined as plain methods being custom.
+
+    `_raw_param_names_set` holds the stored parameters using the default getter,
+    whose values can be read directly from the storage.
     '''
 
-    def __new__(cls, cls_name, bases, namespace, **kwargs):
+    namespace = vars(cls)
+
+    # iterate over each class parameter
+    for name, attr in list(namespace.items()):
+
+        if isinstance(attr, Parameter):
+
+            # give name to parameter
+            attr.name = sys.intern(name)
+
+            # add parameter wither if missing
+            if f'with_{name}' not in namespace:
+                setattr(cls, f'with_{name}', attr.wither())
 
-        # iterate over each class parameter
-        for name, attr in list(namespace.items()):
+            # add parameter caster for stored params if missing
+            if attr.stored and f'cast_{name}' not in namespace:
+                setattr(cls, f'cast_{name}', attr.caster())
 
-            if isinstance(attr, Parameter):
+    # gather attributes by walking the classes dicts along the MRO, the
+    # first definition of a name shadowing the following ones
+    attrs = {}
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            attrs.setdefault(name, attr)
 
-                # give name to parameter
-                attr.name = name
+    parameters = {name: attr for name, attr in attrs.items()
+                  if isinstance(attr, Parameter)}
 
-                # add parameter wither if missing
-                if f'with_{name}' not in namespace:
-                    namespace[f'with_{name}'] = attr.wither()
+    cls._param_names = tuple(sorted(parameters))
+    cls._stored_param_names = tuple(
+        name for name in cls._param_names if parameters[name].stored)
+    cls._param_names_set = frozenset(cls._param_names)
+    cls._stored_param_names_set = frozenset(cls._stored_param_names)
+    cls._stored_casters = tuple((name, attrs[f'cast_{name}'])
+                                for name in cls._stored_param_names)
 
-                # add parameter caster for stored params if missing
-                if attr.stored and f'cast_{name}' not in namespace:
-                    namespace[f'cast_{name}'] = attr.caster()
+    # casters that are not ParameterCaster must be bindable as methods
+    for name, caster in cls._stored_casters:
+        if (not isinstance(caster, ParameterCaster)
+                and not hasattr(caster, '__get__')):
+            raise TypeError(f'The caster cast_{name} must be a ParameterCaster '
+                            f'or a method, got: {type(caster)}.')
 
-        return super().__new__(cls, cls_name, bases, namespace, **kwargs)
+    cls._has_custom_casters = any(not isinstance(caster, ParameterCaster)
+                                  or caster.has_custom_caster
+                                  for _, caster in cls._stored_casters)
+    cls._raw_param_names_set = frozenset(
+        name for name in cls._stored_param_names
+        if not parameters[name].has_custom_getter)
 
 
-class ParametrizedObject(ABC, metaclass=ParametrizedObjectMeta):
+class ParametrizedObject:
     '''
     Stores a unmutable collections of parameters.
 
@@ -67,19 +106,123 @@ class ParametrizedObject(ABC, metaclass=ParametrizedObjectMeta):
     A view on all the object parameters can be gather using `obj.params`.
     '''
 
+    __slots__ = ('params_storage', 'binding')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _wire_parameters(cls)
+
     def __init__(self, *args, **kwargs):
 
         super().__init__()
 
-        self.params_storage = StaticDict(self.stored_params.keys())
+        cls = self.__class__
+
+        # the parameters storage is a plain dict, only written in __init__ where
+        # the keys are always valid stored parameters names
+
+        # copy of an object of the same class with only default casters: the
+        # stored values can be copied as is and only the given ones changed
+        if (not cls._has_custom_casters and len(args) == 1
+                and type(args[0]) is cls):
+
+            content = args[0].params_storage.copy()
+
+            for name, value in kwargs.items():
+
+                if name not in cls._stored_param_names_set:
+                    continue
+
+                # a stored parameter without value is missing
+                if value is None:
+                    raise ValueError(f'Missing value for parameter "{name}".')
+
+                content[name] = value
+
+            self.params_storage = content
 
         # deduce and save stored parameters values
-        for name in self.stored_params:
-            caster = getattr(self, f'cast_{name}')
-            self.params_storage[name] = caster(*args, **kwargs)
+        else:
+
+            content = self.params_storage = {}
+
+            for name, caster in cls._stored_casters:
+
+                if isinstance(caster, ParameterCaster):
+                    value = caster.cast(self, *args, **kwargs)
+
+                # caster defined as a plain method
+                else:
+                    value = caster.__get__(self, cls)(*args, **kwargs)
+
+                # a stored parameter without value is missing
+                if value is None:
+                    raise ValueError(f'Missing value for parameter '
+                                     f'"{name}".')
+
+                # the keys are the stored parameters names, no need to
+                # validate them
+                content[name] = value
 
         self.binding = None
 
+    @classmethod
+    def from_records(cls, rows):
+        '''
+        Returns a list of new objects, one per record of parameters values.
+
+        rows is an iterable of mappings from parameters names to values. A
+        pandas DataFrame or a numpy record array is also accepted, its columns
+        being the parameters names.
+
+        >>> objs = Example.from_records([{'foo': 1}, {'foo': 2, 'bar': 3}])
+
+        If the class has no custom caster (and does not override __init__), the
+        objects are directly built from the parameters defaults and the records
+        values without running the casters. Otherwise, each object is created
+        with `cls(**row)`.
+        '''
+
+        # pandas DataFrame or numpy record array, iterated column-wise
+        columns_names = getattr(rows, 'columns', None)
+        if columns_names is None:
+            columns_names = getattr(getattr(rows, 'dtype', None), 'names', None)
+
+        if columns_names is not None:
+            columns_names = list(columns_names)
+            columns = [rows[name].tolist() for name in columns_names]
+            rows = (dict(zip(columns_names, values))
+                    for values in zip(*columns))
+
+        if (cls._has_custom_casters
+                or cls.__init__ is not ParametrizedObject.__init__):
+            return [cls(**row) for row in rows]
+
+        names = cls._stored_param_names
+        names_set = cls._stored_param_names_set
+        defaults = {name: getattr(cls, name).default for name in names}
+
+        objs = []
+
+        for row in rows:
+
+            content = defaults.copy()
+            content.update((name, value) for name, value in row.items()
+                           if name in names_set)
+
+            # a stored parameter without value is missing
+            for name in names:
+                if content[name] is None:
+                    raise ValueError(f'Missing value for parameter '
+                                     f'"{name}".')
+
+            obj = cls.__new__(cls)
+            obj.params_storage = content
+            obj.binding = None
+            objs.append(obj)
+
+        return objs
+
     def with_params(self, *args, **kwargs):
         '''
         Returns a copy of the object with the given modified parameters values.
@@ -90,9 +233,11 @@ class ParametrizedObject(ABC, metaclass=ParametrizedObjectMeta):
         >>> newobj = obj.with_params({'foo': 42, 'bar': 77})
         '''
 
-        params = dict(*args, **kwargs)
-
-        newobj = self.__class__(self, **params)
+        # kwargs can be forwarded as is if no mapping is given
+        if args:
+            newobj = self.__class__(self, **dict(*args, **kwargs))
+        else:
+            newobj = self.__class__(self, **kwargs)
 
         if self.binding is not None:
             return self.binding.transfer(newobj)
@@ -102,15 +247,13 @@ class ParametrizedObject(ABC, metaclass=ParametrizedObjectMeta):
     @property
     def params(self):
         '''Paramters view (mapping) of all the available parameters.'''
-        cls = self.__class__
-        return ParametersView(self, (name for name, attr in getmembers(cls)
-                                     if isinstance(attr, Parameter)))
+        return ParametersView(self, self._param_names, self._param_names_set)
 
     @property
     def stored_params(self):
         '''Paramters view (mapping) of all the available stored parameters.'''
-        return ParametersView(self, (name for name in self.params.keys()
-                                     if getattr(self.__class__, name).stored))
+        return ParametersView(self, self._stored_param_names,
+                              self._stored_param_names_set)
 
     def bind(self, obj, name):
         '''Returns a copy of the parametrized object bound to obj.'''
@@ -130,11 +273,19 @@ class ParametrizedObject(ABC, metaclass=ParametrizedObjectMeta):
         return copy
 
 
-@dataclass
+_wire_parameters(ParametrizedObject)
+
+
 class ParametrizedObjectBinding:
+    '''
+    Binding of a nested parametrized object to its owning object.
+    '''
+
+    __slots__ = ('obj', 'name')
 
-    obj: ParametrizedObject
-    name: str
+    def __init__(self, obj, name):
+        self.obj = obj
+        self.name = name
 
     def transfer(self, instance):
         return self.obj.with_params(**{self.name: instance})
@@ -2,6 +2,7 @@
 Definition of Parameter.
 '''
 
+import sys
 import paramobject
 
 
@@ -24,11 +25,14 @@ class Parameter:
     attribute yourself.
     '''
 
+    __slots__ = ('_getter_func', 'name', 'stored', 'default')
+
     def __init__(self, getter_func=None, *, stored=True, default=None,
                  name=None):
 
         self.getter_func = getter_func
-        self.name = name
+        # parameters names are identifiers, interning them is always safe
+        self.name = sys.intern(name) if name is not None else None
         self.stored = stored
         self.default = default
 
@@ -38,30 +42,16 @@ class Parameter:
         Returns the getter function to use.
 
         If a custom getter function is defined, the latter is returned.
-        Otherwise, a default getter function is returned.
+        Otherwise, the default getter function is returned.
         '''
 
-        def default_getter_func(instance):
-            '''
-            Default getter function.
-
-            Returns the value of the parameter as stored in the owning object
-            params_storage.
-            '''
-
-            if not self.stored:
-                raise ValueError('The default getter function cannot be used '
-                                 'if the parameter is not stored.')
-
-            return instance.params_storage[self.name]
-
         if self._getter_func is None:
 
             if self.name is None:
                 raise RuntimeError('A nameless parameter cannot use the '
                                    'default getter function')
 
-            return default_getter_func
+            return self.default_getter_func
 
         return self._getter_func
 
@@ -73,12 +63,42 @@ class Parameter:
 
         self._getter_func = func
 
+    @property
+    def has_custom_getter(self):
+        '''True if a custom getter function is defined.'''
+        return self._getter_func is not None
+
+    def default_getter_func(self, instance):
+        '''
+        Default getter function.
+
+        Returns the value of the parameter as stored in the owning object
+        params_storage.
+        '''
+
+        if not self.stored:
+            raise ValueError('The default getter function cannot be used '
+                             'if the parameter is not stored.')
+
+        return instance.params_storage[self.name]
+
     def __get__(self, instance, owner=None):
 
         if instance is None:
             return self
 
-        value = self.getter_func(instance)
+        if self._getter_func is None:
+
+            # inlined default getter function
+            try:
+                value = instance.params_storage[self.name]
+
+            # let the default getter function raise the appropriate error
+            except KeyError:
+                value = self.getter_func(instance)
+
+        else:
+            value = self._getter_func(instance)
 
         if isinstance(value, paramobject.ParametrizedObject):
             return value.bind(instance, self.name)
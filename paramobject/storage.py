@@ -7,6 +7,7 @@ ParametersView helps to access a restricted set of parameters of a parametrized
 object as a read-only mapping.
 '''
 
+import sys
 from collections.abc import Mapping, MutableMapping
 
 
@@ -18,11 +19,17 @@ class StaticDict(MutableMapping):
     Any reading of a key outside the available keys set or of a unset item will
     raise a KeyError.
 
+    Only the set items are present in the `content` dict.
+
     __iter__ returns an interator over all available keys.
     '''
 
+    __slots__ = ('content', '_allowed')
+
     def __init__(self, available_keys):
 
+        keys = []
+
         # check types
         for key in available_keys:
 
@@ -30,37 +37,31 @@ class StaticDict(MutableMapping):
                 raise TypeError(f'Keys are expected to be strings, got '
                                 f'{type(key)}')
 
-        self.content = {key: None for key in available_keys}
-
-    def __getitem__(self, key):
-
-        value = self.content[key]
+            keys.append(sys.intern(key))
 
-        if value is None:
-            raise KeyError(key)
+        self._allowed = frozenset(keys)
+        self.content = {}
 
-        return value
+    def __getitem__(self, key):
+        return self.content[key]
 
     def __setitem__(self, key, value):
 
         # check if key is in the set of keys
-        if key not in self.content:
+        if key not in self._allowed:
             raise KeyError(key)
 
-        # forbid writting None
-        if value is None:
-            raise ValueError(f'Entry "{key}" cannot be set to None.')
-
-        self.content[key] = value
+        # interned keys make the content lookups compare by identity
+        self.content[sys.intern(key)] = value
 
     def __delitem__(self, key):
-        self.content[key] = None
+        del self.content[key]
 
     def __iter__(self):
-        return iter(self.content)
+        return iter(self._allowed)
 
     def __len__(self):
-        return len(self.content)
+        return len(self._allowed)
 
 
 class ParametersView(Mapping):
@@ -68,13 +69,22 @@ class ParametersView(Mapping):
     Read-only view on a restricted set of parameters of a parametrized object.
     '''
 
-    def __init__(self, obj, param_names):
+    __slots__ = ('_obj', '_names', '_names_set')
+
+    def __init__(self, obj, names_tuple, names_set):
         self._obj = obj
-        self._param_names = list(sorted(param_names))
+        self._names = names_tuple
+        self._names_set = names_set
+
+    @classmethod
+    def from_iterable(cls, obj, param_names):
+        '''Creates a view on obj from any iterable of parameters names.'''
+        names = tuple(sorted(sys.intern(name) for name in param_names))
+        return cls(obj, names, frozenset(names))
 
     def __getitem__(self, param_name):
 
-        if param_name not in self._param_names:
+        if param_name not in self._names_set:
             raise KeyError(param_name)
 
         try:
@@ -84,15 +94,33 @@ class ParametersView(Mapping):
             raise KeyError(param_name) from err
 
     def __len__(self):
-        return len(self._param_names)
+        return len(self._names)
 
     def __iter__(self):
-        return iter(self._param_names)
+        return iter(self._names)
+
+    def to_dict(self):
+        '''
+        Returns the parameters values as a dict.
+
+        Stored parameters using the default getter are read directly from the
+        object storage, nested parametrized objects being thus unbound. The
+        other parameters are computed by their getter.
+        '''
+
+        obj = self._obj
+        content = obj.params_storage
+        raw_names = obj.__class__._raw_param_names_set
+
+        return {name: content[name] if name in raw_names
+                else getattr(obj, name) for name in self._names}
 
     def __str__(self):
 
-        maxlen = max(len(name) for name in self)
-        fmt = '{:' + str(maxlen) + '>s} : {}'
+        # the width depends on the names of this view, not on the whole class
+        width = max((len(name) for name in self._names), default=0)
+        fmt = '{:>' + str(width) + 's} : {}'
 
-        lines = [fmt.format(name, repr(value)) for name, value in self.items()]
+        lines = [fmt.format(name, repr(value))
+                 for name, value in self.to_dict().items()]
         return '\n'.join(lines)
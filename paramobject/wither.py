@@ -3,8 +3,8 @@ Definition of ParameterWither.
 
 Each parameter has a wither defined in its owning class. If no wither is
 specified in the class using the `Parameter.wither` decorator, the
-ParametrizedObjectMeta metaclass will make sure that a default will with be
-present in the owning class.
+ParametrizedObject.__init_subclass__ hook will make sure that a default will
+with be present in the owning class.
 
 A wither behaves as a method (but is actually an object) that returns a copy
 of the owning object with a new parameter value. A wither name should start
@@ -50,6 +50,8 @@ class ParameterWither: # pylint: disable=too-few-public-methods
     A helper to create new parametrized object with a new parameter value.
     '''
 
+    __slots__ = ('parameter', '_wither_func', '_resolved_wither_func')
+
     def __init__(self, parameter, wither_func=None):
 
         if not isinstance(parameter, paramobject.Parameter):
@@ -64,40 +66,43 @@ class ParameterWither: # pylint: disable=too-few-public-methods
         Returns the wither function to use.
 
         If a custom wither function is defined, the latter is returned.
-        Otherwise, a default wither function is returned.
+        Otherwise, the default wither function is returned.
         '''
 
-        def default_wither_func(instance, value=None):
-            '''
-            Default wither function.
+        return self._resolved_wither_func
 
-            Returns a copy of the owning object with the new parameters value
-            given in the __init__ **kwargs.
-            '''
+    @wither_func.setter
+    def wither_func(self, func):
 
-            # check if the parameter name is set for the default wither function
-            if self.parameter.name is None:
-                raise RuntimeError('A nameless parameter cannot use the '
-                                   'default wither function')
+        if func is not None and not callable(func):
+            raise TypeError('The wither function must be callable.')
 
-            # use current value if none is given
-            if value is None:
-                value = getattr(instance, self.parameter.name)
+        self._wither_func = func
 
-            return instance.with_params({self.parameter.name: value})
+        # resolve the function once instead of on each lookup
+        if func is None:
+            self._resolved_wither_func = self.default_wither_func
+        else:
+            self._resolved_wither_func = func
 
-        if self._wither_func is None:
-            return default_wither_func
+    def default_wither_func(self, instance, value=None):
+        '''
+        Default wither function.
 
-        return self._wither_func
+        Returns a copy of the owning object with the new parameters value
+        given in the __init__ **kwargs.
+        '''
 
-    @wither_func.setter
-    def wither_func(self, func):
+        # check if the parameter name is set for the default wither function
+        if self.parameter.name is None:
+            raise RuntimeError('A nameless parameter cannot use the '
+                               'default wither function')
 
-        if func is not None and not callable(func):
-            raise TypeError('The wither function must be callable.')
+        # use current value if none is given
+        if value is None:
+            value = getattr(instance, self.parameter.name)
 
-        self._wither_func = func
+        return instance.with_params(**{self.parameter.name: value})
 
     def __get__(self, instance, owner=None):
 
@@ -105,4 +110,4 @@ class ParameterWither: # pylint: disable=too-few-public-methods
             return self
 
         # return the wither function bound to the instance
-        return MethodType(self.wither_func, instance)
+        return MethodType(self._resolved_wither_func, instance)
@@ -5,8 +5,10 @@
 # pylint: disable=missing-function-docstring,
 # pylint: disable=no-self-use
 
+import sys
 import unittest
 from paramobject import ParametrizedObject, parameter, Parameter
+from paramobject.storage import StaticDict
 
 
 class TestParametrizedObject(unittest.TestCase):
@@ -77,6 +79,85 @@ class TestParametrizedObject(unittest.TestCase):
         self.assertEqual(obj.with_bar(10).bar, 10)
         self.assertEqual(obj.with_bar(10, as_string=True).bar, '10')
 
+    def test_copy(self):
+
+        class ClassUnderTest(ParametrizedObject):
+            foo = Parameter(default=42)
+            bar = Parameter()
+
+        # copy with some changed values
+        obj = ClassUnderTest(bar=1)
+        newobj = ClassUnderTest(obj, foo=10, baz=3)
+        self.assertEqual(newobj.foo, 10)
+        self.assertEqual(newobj.bar, 1)
+        self.assertEqual(obj.foo, 42)
+
+        # a stored parameter cannot be unset
+        self.assertRaises(ValueError, ClassUnderTest, obj, bar=None)
+
+    def test_params_view(self):
+
+        class ClassUnderTest(ParametrizedObject):
+
+            foo = Parameter(default=42)
+
+            @parameter(stored=True, default=1)
+            def bar(self):
+                return 11 * self.params_storage['bar']
+
+            @parameter
+            def baz(self):
+                return 2 * self.foo
+
+        obj = ClassUnderTest()
+        self.assertEqual(obj.params.to_dict(),
+                         {'bar': 11, 'baz': 84, 'foo': 42})
+        self.assertEqual(dict(obj.stored_params), {'bar': 11, 'foo': 42})
+        self.assertEqual(str(obj.stored_params), 'bar : 11\nfoo : 42')
+
+        class LongNameClassUnderTest(ClassUnderTest):
+
+            @parameter
+            def very_long_name(self):
+                return self.foo
+
+        # the names are right-aligned on the longest name of the view
+        obj = LongNameClassUnderTest(foo=1)
+        self.assertEqual(str(obj.stored_params), 'bar : 11\nfoo : 1')
+        self.assertEqual(str(obj.params), '           bar : 11\n'
+                                          '           baz : 2\n'
+                                          '           foo : 1\n'
+                                          'very_long_name : 1')
+
+    def test_from_records(self):
+
+        class ClassUnderTest(ParametrizedObject):
+            foo = Parameter(default=42)
+            bar = Parameter()
+
+        objs = ClassUnderTest.from_records([{'bar': 1}, {'foo': 2, 'bar': 3}])
+        self.assertEqual([(obj.foo, obj.bar) for obj in objs],
+                         [(42, 1), (2, 3)])
+        self.assertEqual(objs[0].with_foo(10).foo, 10)
+
+        # missing mandatory parameter value must raise ValueError
+        self.assertRaises(ValueError, ClassUnderTest.from_records, [{'foo': 1}])
+
+        # column-wise records, as a pandas DataFrame would provide them
+        class Column(list):
+            def tolist(self):
+                return list(self)
+
+        class Frame(dict):
+            @property
+            def columns(self):
+                return list(self)
+
+        frame = Frame(bar=Column([1, 3]), foo=Column([2, 4]))
+        objs = ClassUnderTest.from_records(frame)
+        self.assertEqual([(obj.foo, obj.bar) for obj in objs],
+                         [(2, 1), (4, 3)])
+
     def test_caster(self):
 
         class ClassUnderTest(ParametrizedObject):
@@ -116,6 +197,30 @@ class TestParametrizedObject(unittest.TestCase):
         obj = ClassUnderTest()
         self.assertEqual(obj.with_radius(100).diameter, 200)
 
+        # check records
+        objs = ClassUnderTest.from_records([{'radius': 1}, {'diameter': 4}])
+        self.assertEqual([obj.radius for obj in objs], [1, 2])
+
+    def test_method_caster(self):
+
+        class ClassUnderTest(ParametrizedObject):
+
+            radius = Parameter(default=1)
+
+            def cast_radius(self, *args, **kwargs):
+                return 2 * kwargs.get('radius', 1)
+
+        self.assertEqual(ClassUnderTest().radius, 2)
+        self.assertEqual(ClassUnderTest(radius=3).radius, 6)
+
+        # a caster must be bindable to the object
+        with self.assertRaises(TypeError):
+
+            # pylint: disable-next=unused-variable
+            class InvalidClassUnderTest(ParametrizedObject):
+                radius = Parameter(default=1)
+                cast_radius = 42
+
     def test_subclassing(self):
 
         class ClassUnderTest(ParametrizedObject):
@@ -148,5 +253,31 @@ class TestParametrizedObject(unittest.TestCase):
         self.assertEqual(obj.foo.with_bar(10).foo.bar, 10)
 
 
+class TestStaticDict(unittest.TestCase):
+
+    def test_presence(self):
+
+        storage = StaticDict(['foo', 'bar'])
+
+        # unset and unavailable keys must raise KeyError
+        self.assertRaises(KeyError, storage.__getitem__, 'foo')
+        self.assertRaises(KeyError, storage.__setitem__, 'baz', 1)
+
+        # None is a valid value
+        storage['foo'] = None
+        self.assertIsNone(storage['foo'])
+
+        del storage['foo']
+        self.assertRaises(KeyError, storage.__getitem__, 'foo')
+        self.assertEqual(set(storage), {'foo', 'bar'})
+
+        # keys are stored interned
+        storage = StaticDict([''.join(['foo', '_bar'])])
+        key = ''.join(['foo', '_bar'])
+        storage[key] = 1
+        self.assertIsNot(next(iter(storage.content)), key)
+        self.assertIs(next(iter(storage.content)), sys.intern(key))
+
+
 if __name__ == '__main__':
     unittest.main()